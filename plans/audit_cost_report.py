@@ -11,6 +11,40 @@ import sys
 from collections import defaultdict
 from pathlib import Path
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:  # pragma: no cover - stdlib fallback
+    _loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - pure-Python fallback
+    np = None
+
+# Below this size a full sort is cheaper than partial selection.
+PARTITION_MIN_N = 1024
+
+
+def iter_jsonl_lines(path: Path, chunk_size: int = 1 << 20):
+    """Yield complete lines (as bytes) from a JSONL file.
+
+    Reads fixed-size binary chunks and splits on newlines, carrying the
+    partial tail line across chunk boundaries. Avoids buffered-text
+    readline, which is ~2x slower than splitting the raw byte stream.
+    """
+    leftover = b""
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            lines = (leftover + chunk).split(b"\n")
+            leftover = lines[-1]
+            yield from lines[:-1]
+    if leftover:
+        yield leftover
+
 
 def percentile(sorted_values: list[float], p: float) -> float:
     """Calculate percentile from sorted list."""
@@ -22,6 +56,33 @@ def percentile(sorted_values: list[float], p: float) -> float:
     return sorted_values[f] + (sorted_values[c] - sorted_values[f]) * (k - f)
 
 
+def quantiles(values: list[float], ps: list[float]) -> list[float]:
+    """Compute several quantiles of values in one pass.
+
+    With numpy available this sorts once in C and interpolates all
+    quantiles together; otherwise falls back to the pure-Python path.
+    """
+    if np is not None:
+        arr = np.asarray(values, dtype=np.float64)
+        n = arr.size
+        if n > PARTITION_MIN_N:
+            # Selection beats a full sort on large arrays: partition on the
+            # bracketing ranks of every target quantile, then interpolate
+            # linearly between part[k] and part[k+1].
+            kth = sorted({r for p in ps for k in (int((n - 1) * p),) for r in (k, min(k + 1, n - 1))})
+            part = np.partition(arr, kth)
+            out = []
+            for p in ps:
+                k = (n - 1) * p
+                f = int(k)
+                c = min(f + 1, n - 1)
+                out.append(float(part[f] + (part[c] - part[f]) * (k - f)))
+            return out
+        return [float(q) for q in np.quantile(arr, ps, method="linear")]
+    values_sorted = sorted(values)
+    return [percentile(values_sorted, p) for p in ps]
+
+
 def main():
     # Parse arguments
     jsonl_path = Path(".context/audit_costs.jsonl")
@@ -35,26 +96,26 @@ def main():
         print(f"ERROR: {jsonl_path} not found", file=sys.stderr)
         sys.exit(1)
 
-    # Parse JSONL
+    # Parse JSONL: stream binary chunks and split on newlines, rather than
+    # decoding and parsing line-by-line (the workload is parse-bound).
     records = []
-    with open(jsonl_path, "r", encoding="utf-8") as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                records.append(json.loads(line))
-            except json.JSONDecodeError as e:
-                print(f"WARNING: Line {line_num}: invalid JSON: {e}", file=sys.stderr)
+    for line_num, line in enumerate(iter_jsonl_lines(jsonl_path), 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            records.append(_loads(line))
+        except _JSONDecodeError as e:
+            print(f"WARNING: Line {line_num}: invalid JSON: {e}", file=sys.stderr)
 
     if not records:
         print("No records found in audit_costs.jsonl")
         sys.exit(0)
 
-    # Group by stage
-    stage_durations: dict[str, list[float]] = defaultdict(list)
-    stage_cache_hits: dict[str, int] = defaultdict(int)
-    stage_cache_total: dict[str, int] = defaultdict(int)
+    # Group by stage. One accumulator per stage holding parallel slots
+    # [durations, cache_hits, cache_total] instead of three defaultdicts,
+    # so the hot loop does a single dict lookup per record.
+    stage_stats: dict[str, list] = {}
 
     # Track runs
     runs: dict[str, dict] = defaultdict(dict)
@@ -69,12 +130,13 @@ def main():
             runs[run_id]["total_duration_s"] = rec.get("total_duration_s", 0)
         else:
             duration = rec.get("duration_s", 0)
-            stage_durations[stage].append(duration)
-
-            cache_hit = rec.get("cache_hit", False)
-            stage_cache_total[stage] += 1
-            if cache_hit:
-                stage_cache_hits[stage] += 1
+            stats = stage_stats.get(stage)
+            if stats is None:
+                stats = stage_stats[stage] = [[], 0, 0]
+            stats[0].append(duration)
+            stats[2] += 1
+            if rec.get("cache_hit", False):
+                stats[1] += 1
 
             # Track stage in run
             if "stages" not in runs[run_id]:
@@ -90,22 +152,18 @@ def main():
     print("Stage Performance (all runs):")
     stage_order = ["contract_digest", "plan_digest", "roadmap_digest", "slice_prepare", "auditor"]
     for stage in stage_order:
-        durations = stage_durations.get(stage, [])
+        stats = stage_stats.get(stage)
+        durations = stats[0] if stats else []
         if not durations:
             continue
-        durations_sorted = sorted(durations)
-        min_v = durations_sorted[0]
-        max_v = durations_sorted[-1]
-        median = percentile(durations_sorted, 0.5)
-        p90 = percentile(durations_sorted, 0.9)
-        p95 = percentile(durations_sorted, 0.95)
+        min_v, median, p90, p95, max_v = quantiles(durations, [0.0, 0.5, 0.9, 0.95, 1.0])
         print(f"  {stage}: min={min_v:.0f}s, median={median:.0f}s, p90={p90:.0f}s, p95={p95:.0f}s, max={max_v:.0f}s")
 
     # Print total duration stats
     total_durations = [r.get("total_duration_s", 0) for r in runs.values() if r.get("total_duration_s")]
     if total_durations:
-        total_sorted = sorted(total_durations)
-        print(f"\nTotal Duration: min={total_sorted[0]:.0f}s, median={percentile(total_sorted, 0.5):.0f}s, p90={percentile(total_sorted, 0.9):.0f}s")
+        total_min, total_median, total_p90 = quantiles(total_durations, [0.0, 0.5, 0.9])
+        print(f"\nTotal Duration: min={total_min:.0f}s, median={total_median:.0f}s, p90={total_p90:.0f}s")
 
     # Print run summary
     completed_runs = sum(1 for r in runs.values() if r.get("decision"))
@@ -122,8 +180,9 @@ def main():
     # Print cache performance
     print("\nCache Performance:")
     for stage in stage_order:
-        total = stage_cache_total.get(stage, 0)
-        hits = stage_cache_hits.get(stage, 0)
+        stats = stage_stats.get(stage)
+        total = stats[2] if stats else 0
+        hits = stats[1] if stats else 0
         if total > 0:
             hit_rate = (hits / total) * 100
             print(f"  {stage}: hit_rate={hit_rate:.0f}% ({hits}/{total})")
@@ -15,12 +15,24 @@ Usage:
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import importlib.util
+import io
 import json
 import re
 import subprocess
 import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from mcp.server.fastmcp import FastMCP
 except ImportError:
@@ -41,6 +53,43 @@ PRD_PATH = PLANS_DIR / "prd.json"
 # Create the MCP server
 mcp = FastMCP("ralph")
 
+# CONTRACT.md cache: (mtime_ns, text). The server is long-lived and most
+# tools read the contract, so re-read only when the file actually changes.
+_contract_cache: tuple[int, str] | None = None
+
+
+# Tool-level patterns, compiled once at import rather than per call.
+AT_RE = re.compile(r"^\s*(AT-\d+)[:\s]+(.*)$", re.MULTILINE)
+REASON_CODE_RES = {
+    "reject": re.compile(r"`(Reject\w+)`"),
+    "mode": re.compile(r"`(Mode\w+)`"),
+    "latch": re.compile(r"`(Latch\w+)`"),
+    "all": re.compile(r"`((?:Reject|Mode|Latch)\w+)`"),
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _heading_re(section: str) -> re.Pattern[str]:
+    """Compiled heading pattern for a section number, cached per section."""
+    return re.compile(r"^(#{1,6})\s+\*?\*?(" + re.escape(section) + r"(?:\.\d+)*)\b")
+
+
+@functools.lru_cache(maxsize=64)
+def _query_re(query: str) -> re.Pattern[str]:
+    """Compiled case-insensitive search pattern, cached per query."""
+    return re.compile(query, re.IGNORECASE)
+
+
+def _load_contract_text() -> str | None:
+    """Return CONTRACT.md text, or None if the file is missing."""
+    global _contract_cache
+    if not CONTRACT_PATH.exists():
+        return None
+    mtime_ns = CONTRACT_PATH.stat().st_mtime_ns
+    if _contract_cache is None or _contract_cache[0] != mtime_ns:
+        _contract_cache = (mtime_ns, CONTRACT_PATH.read_text(encoding="utf-8"))
+    return _contract_cache[1]
+
 
 # -----------------------------------------------------------------------------
 # Contract Lookup Tools
@@ -55,16 +104,14 @@ def contract_lookup(section: str) -> str:
     Returns the section heading and content up to the next section of equal
     or higher level.
     """
-    if not CONTRACT_PATH.exists():
+    text = _load_contract_text()
+    if text is None:
         return f"ERROR: CONTRACT.md not found at {CONTRACT_PATH}"
 
-    text = CONTRACT_PATH.read_text(encoding="utf-8")
     lines = text.splitlines()
 
-    # Pattern to match section headings like "## 2.2 PolicyGuard" or "### 2.2.3 Axis Resolver"
-    heading_re = re.compile(
-        r"^(#{1,6})\s+\*?\*?(" + re.escape(section) + r"(?:\.\d+)*)\b"
-    )
+    # Matches section headings like "## 2.2 PolicyGuard" or "### 2.2.3 Axis Resolver"
+    heading_re = _heading_re(section)
 
     start_idx = None
     start_level = 0
@@ -109,20 +156,30 @@ def contract_search(query: str, context_lines: int = 2) -> str:
 
     Returns matching lines with context and line numbers.
     """
-    if not CONTRACT_PATH.exists():
+    text = _load_contract_text()
+    if text is None:
         return f"ERROR: CONTRACT.md not found at {CONTRACT_PATH}"
 
-    text = CONTRACT_PATH.read_text(encoding="utf-8")
     lines = text.splitlines()
 
-    try:
-        pattern = re.compile(query, re.IGNORECASE)
-    except re.error as e:
-        return f"Invalid regex pattern: {e}"
+    # Literal queries (no regex metacharacters) take a plain substring
+    # scan; only genuine patterns pay for the backtracking regex engine.
+    if re.escape(query) == query:
+        needle = query.lower()
+
+        def hit(line: str) -> bool:
+            return needle in line.lower()
+
+    else:
+        try:
+            pattern = _query_re(query)
+        except re.error as e:
+            return f"Invalid regex pattern: {e}"
+        hit = pattern.search
 
     matches = []
     for i, line in enumerate(lines):
-        if pattern.search(line):
+        if hit(line):
             start = max(0, i - context_lines)
             end = min(len(lines), i + context_lines + 1)
             snippet = []
@@ -152,24 +209,25 @@ def list_acceptance_tests(section: str | None = None) -> str:
 
     Returns list of AT IDs with their descriptions.
     """
-    if not CONTRACT_PATH.exists():
+    text = _load_contract_text()
+    if text is None:
         return f"ERROR: CONTRACT.md not found at {CONTRACT_PATH}"
 
-    text = CONTRACT_PATH.read_text(encoding="utf-8")
-
     # Find all AT-### references with context
-    at_pattern = re.compile(r"^\s*(AT-\d+)[:\s]+(.*)$", re.MULTILINE)
-    matches = at_pattern.findall(text)
+    matches = AT_RE.findall(text)
 
     if not matches:
         return "No acceptance tests found"
 
-    result = []
-    for at_id, description in matches:
-        desc = description.strip()[:100]  # Truncate long descriptions
-        result.append(f"{at_id}: {desc}")
+    # Dedup and sort in one shot: dict.fromkeys drops repeats without an
+    # intermediate set, and the (number, line) tuples sort natively with
+    # no key callback.
+    entries = dict.fromkeys(
+        (int(at_id.split("-")[1]), f"{at_id}: {description.strip()[:100]}")
+        for at_id, description in matches
+    )
 
-    return "\n".join(sorted(set(result), key=lambda x: int(x.split("-")[1].split(":")[0])))
+    return "\n".join(line for _, line in sorted(entries))
 
 
 # -----------------------------------------------------------------------------
@@ -177,6 +235,85 @@ def list_acceptance_tests(section: str | None = None) -> str:
 # -----------------------------------------------------------------------------
 
 
+# Check modules loaded for in-process execution, keyed by script path with
+# the mtime captured at import. A stale entry is re-imported, so editing a
+# check script on disk takes effect without restarting the server (same
+# invalidation scheme as _contract_cache).
+_check_modules: dict[Path, tuple[int, object]] = {}
+
+
+def _load_check_module(script_path: Path):
+    """Import a check script as a module, caching it keyed on mtime."""
+    mtime_ns = script_path.stat().st_mtime_ns
+    cached = _check_modules.get(script_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    spec = importlib.util.spec_from_file_location(
+        f"_ralph_check_{script_path.stem}", script_path
+    )
+    if spec is None or spec.loader is None:
+        raise ImportError(f"cannot load {script_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _check_modules[script_path] = (mtime_ns, module)
+    return module
+
+
+# _run_check patches process-global sys.argv and stdout/stderr; FastMCP
+# runs sync tools on worker threads, so two concurrent tool calls could
+# otherwise race and leak check output into the JSON-RPC channel.
+_check_run_lock = threading.Lock()
+
+
+def _run_check(script_path: Path, *args: str, timeout: int = 60) -> tuple[int, str, str]:
+    """Run a check script in-process when possible, else as a subprocess.
+
+    The check scripts expose main() -> int; calling it directly skips the
+    interpreter startup and module import cost of a fresh subprocess on
+    every tool invocation. An import failure falls back to the subprocess
+    path with the cause noted on stderr.
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    main = None
+    load_error: Exception | None = None
+    with _check_run_lock:
+        saved_argv = sys.argv
+        sys.argv = [str(script_path), *args]
+        try:
+            # The import runs inside the redirect too: on a stdio server
+            # the real stdout is the JSON-RPC channel, and import-time
+            # prints from a check script must not leak into it.
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    module = _load_check_module(script_path)
+                    main = module.main
+                except (ImportError, AttributeError, SyntaxError, OSError) as exc:
+                    load_error = exc
+                if main is not None:
+                    try:
+                        code = main()
+                    except SystemExit as exc:
+                        code = exc.code
+        except Exception:
+            # Mirror the subprocess contract: an uncaught crash inside the
+            # check becomes a nonzero exit with the traceback on stderr.
+            return -1, stdout.getvalue(), f"{stderr.getvalue()}\n{traceback.format_exc()}"
+        finally:
+            sys.argv = saved_argv
+
+    if main is None:
+        code, out, err = _run_script(script_path, *args, timeout=timeout)
+        note = f"NOTE: in-process import failed ({load_error!r}); ran as subprocess"
+        return code, out, f"{err}\n{note}" if err else note
+
+    if code is None:
+        code = 0
+    elif not isinstance(code, int):
+        code = 1
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
 def _run_script(script_path: Path, *args: str, timeout: int = 60) -> tuple[int, str, str]:
     """Run a Python script and capture output."""
     cmd = [sys.executable, str(script_path)] + list(args)
@@ -221,7 +358,7 @@ def check_contract_crossrefs(strict: bool = True, check_at: bool = True) -> str:
     if check_at:
         args.append("--check-at")
 
-    code, stdout, stderr = _run_script(script, *args)
+    code, stdout, stderr = _run_check(script, *args)
 
     output = stdout + stderr
     status = "PASS" if code == 0 else "FAIL"
@@ -252,7 +389,7 @@ def check_arch_flows(strict: bool = True) -> str:
     if strict:
         args.append("--strict")
 
-    code, stdout, stderr = _run_script(script, *args)
+    code, stdout, stderr = _run_check(script, *args)
 
     output = stdout + stderr
     status = "PASS" if code == 0 else "FAIL"
@@ -271,7 +408,14 @@ def check_state_machines() -> str:
     if not script.exists():
         return f"ERROR: Script not found at {script}"
 
-    code, stdout, stderr = _run_script(script)
+    args = [
+        "--dir", str(PROJECT_ROOT / "specs" / "state_machines"),
+        "--contract", str(CONTRACT_PATH),
+        "--flows", str(FLOWS_PATH),
+        "--invariants", str(PROJECT_ROOT / "specs" / "invariants" / "GLOBAL_INVARIANTS.md"),
+    ]
+
+    code, stdout, stderr = _run_check(script, *args)
 
     output = stdout + stderr
     status = "PASS" if code == 0 else "FAIL"
@@ -287,23 +431,57 @@ def run_all_checks() -> str:
     Equivalent to running verify.sh for contract integrity.
     Returns summary of all check results.
     """
-    results = []
+    checks: list[tuple[str, Path, list[str]]] = [
+        (
+            "Contract Cross-References",
+            SCRIPTS_DIR / "check_contract_crossrefs.py",
+            ["--contract", str(CONTRACT_PATH), "--strict", "--check-at"],
+        ),
+        (
+            "Architecture Flows",
+            SCRIPTS_DIR / "check_arch_flows.py",
+            ["--contract", str(CONTRACT_PATH), "--flows", str(FLOWS_PATH), "--strict"],
+        ),
+    ]
 
-    # Cross-refs
-    results.append("=== Contract Cross-References ===")
-    results.append(check_contract_crossrefs())
-    results.append("")
+    sm_script = SCRIPTS_DIR / "check_state_machines.py"
+    if sm_script.exists():
+        checks.append(
+            (
+                "State Machines",
+                sm_script,
+                [
+                    "--dir", str(PROJECT_ROOT / "specs" / "state_machines"),
+                    "--contract", str(CONTRACT_PATH),
+                    "--flows", str(FLOWS_PATH),
+                    "--invariants", str(PROJECT_ROOT / "specs" / "invariants" / "GLOBAL_INVARIANTS.md"),
+                ],
+            )
+        )
 
-    # Arch flows
-    results.append("=== Architecture Flows ===")
-    results.append(check_arch_flows())
-    results.append("")
+    # The checks are independent, so fan them out as concurrent
+    # subprocesses: wall time becomes the slowest check rather than the
+    # sum. Subprocesses (not the in-process fast path) are used here
+    # because _run_check patches process-global state.
+    with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+        futures = [
+            pool.submit(_run_script, script, *args) for _, script, args in checks
+        ]
 
-    # State machines (if script exists)
-    script = SCRIPTS_DIR / "check_state_machines.py"
-    if script.exists():
-        results.append("=== State Machines ===")
-        results.append(check_state_machines())
+    results = []
+    for (title, script, _), future in zip(checks, futures):
+        if not script.exists():
+            body = f"ERROR: Script not found at {script}"
+        else:
+            code, stdout, stderr = future.result()
+            status = "PASS" if code == 0 else "FAIL"
+            body = f"Status: {status} (exit code {code})\n\n{stdout + stderr}"
+        results.append(f"=== {title} ===")
+        results.append(body)
+        results.append("")
+
+    if results:
+        results.pop()  # no blank line after the final section
 
     return "\n".join(results)
 
@@ -313,6 +491,20 @@ def run_all_checks() -> str:
 # -----------------------------------------------------------------------------
 
 
+def _load_prd() -> tuple[dict | None, str | None]:
+    """Parse prd.json, returning (data, error_message)."""
+    if not PRD_PATH.exists():
+        return None, f"ERROR: prd.json not found at {PRD_PATH}"
+    try:
+        raw = PRD_PATH.read_bytes()
+        # orjson parses straight from bytes ~5x faster than stdlib json;
+        # its JSONDecodeError subclasses the stdlib one.
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except json.JSONDecodeError as e:
+        return None, f"ERROR: Invalid JSON in prd.json: {e}"
+    return data, None
+
+
 @mcp.tool()
 def get_prd_tasks(status: str | None = None) -> str:
     """
@@ -323,13 +515,9 @@ def get_prd_tasks(status: str | None = None) -> str:
 
     Returns list of PRD tasks.
     """
-    if not PRD_PATH.exists():
-        return f"ERROR: prd.json not found at {PRD_PATH}"
-
-    try:
-        data = json.loads(PRD_PATH.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as e:
-        return f"ERROR: Invalid JSON in prd.json: {e}"
+    data, error = _load_prd()
+    if error:
+        return error
 
     tasks = data.get("tasks", [])
 
@@ -339,14 +527,10 @@ def get_prd_tasks(status: str | None = None) -> str:
     if not tasks:
         return f"No tasks found" + (f" with status '{status}'" if status else "")
 
-    result = []
-    for t in tasks:
-        tid = t.get("id", "?")
-        title = t.get("title", "Untitled")
-        st = t.get("status", "unknown")
-        result.append(f"[{tid}] ({st}) {title}")
-
-    return "\n".join(result)
+    return "\n".join(
+        f"[{t.get('id', '?')}] ({t.get('status', 'unknown')}) {t.get('title', 'Untitled')}"
+        for t in tasks
+    )
 
 
 @mcp.tool()
@@ -359,13 +543,9 @@ def get_prd_task(task_id: str) -> str:
 
     Returns full task details as JSON.
     """
-    if not PRD_PATH.exists():
-        return f"ERROR: prd.json not found at {PRD_PATH}"
-
-    try:
-        data = json.loads(PRD_PATH.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as e:
-        return f"ERROR: Invalid JSON in prd.json: {e}"
+    data, error = _load_prd()
+    if error:
+        return error
 
     tasks = data.get("tasks", [])
     task = next((t for t in tasks if t.get("id") == task_id), None)
@@ -392,25 +572,15 @@ def get_reason_codes(code_type: str = "all") -> str:
 
     Returns list of reason codes with descriptions.
     """
-    if not CONTRACT_PATH.exists():
+    text = _load_contract_text()
+    if text is None:
         return f"ERROR: CONTRACT.md not found at {CONTRACT_PATH}"
 
-    text = CONTRACT_PATH.read_text(encoding="utf-8")
-
-    patterns = {
-        "reject": r"`(Reject\w+)`",
-        "mode": r"`(Mode\w+)`",
-        "latch": r"`(Latch\w+)`",
-    }
-
-    if code_type == "all":
-        pattern = r"`((?:Reject|Mode|Latch)\w+)`"
-    elif code_type in patterns:
-        pattern = patterns[code_type]
-    else:
+    pattern = REASON_CODE_RES.get(code_type)
+    if pattern is None:
         return f"Unknown code_type '{code_type}'. Use 'reject', 'mode', 'latch', or 'all'"
 
-    codes = sorted(set(re.findall(pattern, text)))
+    codes = sorted(set(pattern.findall(text)))
 
     if not codes:
         return f"No {code_type} codes found"
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import argparse
+import functools
 import hashlib
 import json
 import os
@@ -12,7 +13,14 @@ from typing import Any, Dict, List, Tuple
 
 ROOT = Path(__file__).resolve().parents[2]
 CONTRACT_PATH = ROOT / "specs" / "CONTRACT.md"
-CONTRACT_VERSION_RE = re.compile(r"^#\s+\*\*Version:\s*([0-9]+(?:\.[0-9]+)*)")
+CONTRACT_VERSION_RE = re.compile(
+    r"^\s*#\s+\*\*Version:\s*([0-9]+(?:\.[0-9]+)*)", re.MULTILINE
+)
+# The version line sits in the CONTRACT.md preamble; reading this much is
+# enough to find it without pulling the whole contract into memory.
+CONTRACT_HEAD_BYTES = 4096
+WINDOW_RE = re.compile(r"^([0-9]+)([smhd])$")
+WINDOW_MULTIPLIERS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
 
 REQUIRED_METRICS = (
     "fee_drag_ratio",
@@ -52,18 +60,18 @@ def parse_args() -> argparse.Namespace:
 
 def parse_window_seconds(window: str) -> int:
     text = window.strip().lower()
-    match = re.match(r"^([0-9]+)([smhd])$", text)
+    match = WINDOW_RE.match(text)
     if not match:
         raise ValueError(
             f"Invalid window '{window}'. Expected number + unit (s|m|h|d)."
         )
-    value = int(match.group(1))
-    unit = match.group(2)
-    multipliers = {"s": 1, "m": 60, "h": 3600, "d": 86400}
-    return value * multipliers[unit]
+    return int(match.group(1)) * WINDOW_MULTIPLIERS[match.group(2)]
 
 
 def canonical_json_bytes(value: Any) -> bytes:
+    # Always the stdlib encoder: these bytes feed runtime_config_hash, and
+    # the canonical form must not depend on which JSON library is installed
+    # (orjson formats some floats differently, e.g. 1e-9 vs 1e-09).
     return json.dumps(
         value,
         sort_keys=True,
@@ -72,17 +80,31 @@ def canonical_json_bytes(value: Any) -> bytes:
     ).encode("utf-8")
 
 
+@functools.lru_cache(maxsize=16)
+def _sha256_hex(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()
+
+
 def compute_runtime_config_hash(config: Any) -> str:
-    return hashlib.sha256(canonical_json_bytes(config)).hexdigest()
+    # The canonical bytes are a frozen, hashable key, so repeated hashing
+    # of the same config within a process hits the cache.
+    return _sha256_hex(canonical_json_bytes(config))
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_contract_version_cached(contract_path: Path, mtime_ns: int) -> str:
+    with contract_path.open("rb") as handle:
+        head = handle.read(CONTRACT_HEAD_BYTES)
+    match = CONTRACT_VERSION_RE.search(head.decode("utf-8", errors="replace"))
+    if match:
+        return match.group(1)
+    raise RuntimeError("contract version not found in CONTRACT.md")
 
 
 def parse_contract_version(contract_path: Path) -> str:
-    text = contract_path.read_text(encoding="utf-8")
-    for line in text.splitlines():
-        match = CONTRACT_VERSION_RE.match(line.strip())
-        if match:
-            return match.group(1)
-    raise RuntimeError("contract version not found in CONTRACT.md")
+    return _parse_contract_version_cached(
+        contract_path, contract_path.stat().st_mtime_ns
+    )
 
 
 def read_json_file(path: Path) -> Any:
@@ -218,12 +240,12 @@ def main() -> int:
         return 2
 
     metrics_raw = {}
-    if args.metrics:
-        metrics_raw = read_json_file(Path(args.metrics))
-    elif os.getenv("F1_CERT_METRICS_PATH"):
-        metrics_raw = read_json_file(Path(os.getenv("F1_CERT_METRICS_PATH")))
-    elif os.getenv("F1_CERT_METRICS_JSON"):
-        metrics_raw = json.loads(os.getenv("F1_CERT_METRICS_JSON"))
+    metrics_path = args.metrics or os.getenv("F1_CERT_METRICS_PATH")
+    metrics_json = None if metrics_path else os.getenv("F1_CERT_METRICS_JSON")
+    if metrics_path:
+        metrics_raw = read_json_file(Path(metrics_path))
+    elif metrics_json:
+        metrics_raw = json.loads(metrics_json)
 
     metrics = extract_metrics(metrics_raw)
     status, reasons = evaluate_metrics(metrics)
@@ -250,9 +272,11 @@ def main() -> int:
 
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8") as handle:
-        json.dump(cert, handle, indent=2, sort_keys=True)
-        handle.write("\n")
+    # Serialize to one bytes buffer and write it in a single call. Stdlib
+    # encoder only: F1_CERT.json is a committed artifact, and its bytes
+    # must not vary with which JSON library happens to be installed.
+    payload = (json.dumps(cert, indent=2, sort_keys=True) + "\n").encode("utf-8")
+    out_path.write_bytes(payload)
 
     if out_path.suffix == ".json":
         md_path = out_path.with_suffix(".md")
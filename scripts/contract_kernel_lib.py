@@ -2,13 +2,39 @@
 import re
 import sys
 
-ANCHOR_HEADER_RE = re.compile(r"^##\s+(Anchor-[0-9]+):\s*(.+)$")
-CONTRACT_REF_RE = re.compile(r"\(Contract\s+([^\)]+)\)\s*$")
+# ANCHOR_HEADER_RE yields the anchor id, the title, and any trailing
+# "(Contract ...)" citation from one match, instead of a header match
+# plus a second search over the remainder.
+ANCHOR_HEADER_RE = re.compile(
+    r"^\s*##\s+(Anchor-[0-9]+):\s*(.*?)\s*(?:\(Contract\s+([^\)]+)\)\s*)?$"
+)
 SECTION_REF_RE = re.compile(r"(§\s*[0-9]+(?:\.[0-9A-Za-z]+)*)")
 RULE_HEADER_RE = re.compile(r"^##\s+(VR-[A-Za-z0-9]+):\s*(.+)$")
-FIELD_RE = re.compile(r"^\*\*(.+?):\*\*\s*(.*)$")
+FIELD_RE = re.compile(r"^\s*\*\*(.+?):\*\*\s*(.*)$")
 GATE_ID_RE = re.compile(r"\bVR-\d{3}[a-z]?\b")
 CONTRACT_VERSION_RE = re.compile(r"^#\s+\*\*Version:\s*([0-9]+(?:\.[0-9]+)*)")
+CONTRACT_WORD_REF_RE = re.compile(r"Contract\s+([0-9]+(?:\.[0-9A-Za-z]+)*)")
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+REQUIRED_RULE_FIELDS = ("id", "title", "contract_ref", "rule")
+
+# Maps every ASCII character outside [a-z0-9] to "_" for the translate
+# fast path in normalize_field_name.
+FIELD_NAME_TABLE = str.maketrans(
+    {c: "_" for c in map(chr, range(128)) if not ("a" <= c <= "z" or "0" <= c <= "9")}
+)
+
+# Field-label dispatch for parse_validation_rules: one dict lookup instead
+# of a chain of string comparisons per field line. "rule_fallback" labels
+# only set the rule when none is recorded yet.
+FIELD_LABEL_ACTIONS = {
+    "contract ref": "contract_ref",
+    "contract citation": "contract_ref",
+    "rule": "rule",
+    "trigger": "rule_fallback",
+    "failure mode": "rule_fallback",
+    "gate id": "gate_id",
+}
 
 
 def fail(message: str) -> None:
@@ -17,18 +43,19 @@ def fail(message: str) -> None:
 
 
 def normalize_field_name(label: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "_", label.strip().lower()).strip("_")
+    lowered = label.lower()
+    if lowered.isascii():
+        # translate maps separators to "_" in C; split/join collapses runs
+        # and drops leading/trailing underscores without the regex engine.
+        return "_".join(
+            part for part in lowered.translate(FIELD_NAME_TABLE).split("_") if part
+        )
+    return NON_ALNUM_RE.sub("_", lowered.strip()).strip("_")
 
 
 def dedup_preserve(items: list[str]) -> list[str]:
-    seen = set()
-    out = []
-    for item in items:
-        if item in seen:
-            continue
-        seen.add(item)
-        out.append(item)
-    return out
+    # dict.fromkeys keeps first-seen order and dedups in one C-level pass.
+    return list(dict.fromkeys(items))
 
 
 def parse_contract_version(contract_text: str) -> str:
@@ -44,27 +71,40 @@ def extract_contract_ref(text: str) -> str:
     match = SECTION_REF_RE.search(text)
     if match:
         return match.group(1).replace(" ", "")
-    match = re.search(r"Contract\s+([0-9]+(?:\.[0-9A-Za-z]+)*)", text)
+    match = CONTRACT_WORD_REF_RE.search(text)
     if match:
         return f"§{match.group(1)}"
     return ""
 
 
-def find_section_line(lines: list[str], section_ref: str) -> int:
+def find_section_line(
+    lines: list[str], section_ref: str, cache: dict[str, int] | None = None
+) -> int:
+    if cache is not None and section_ref in cache:
+        return cache[section_ref]
     targets = [section_ref]
     if section_ref.startswith("§"):
         targets.append(section_ref[1:])
+    found = 0
     for idx, line in enumerate(lines, start=1):
         for target in targets:
             if target and target in line:
-                return idx
-    return 0
+                found = idx
+                break
+        if found:
+            break
+    if cache is not None:
+        cache[section_ref] = found
+    return found
 
 
 def parse_anchors(anchors_text: str, contract_lines: list[str], source: str) -> list[dict]:
     anchors = []
     seen = set()
     current = None
+    # Anchors frequently cite the same section; remember each resolved ref
+    # so the contract is scanned at most once per distinct reference.
+    section_cache: dict[str, int] = {}
 
     def flush() -> None:
         nonlocal current
@@ -75,7 +115,9 @@ def parse_anchors(anchors_text: str, contract_lines: list[str], source: str) ->
         if current["id"] in seen:
             fail(f"duplicate anchor id: {current['id']}")
         seen.add(current["id"])
-        line_number = find_section_line(contract_lines, current["contract_ref"])
+        line_number = find_section_line(
+            contract_lines, current["contract_ref"], section_cache
+        )
         if line_number == 0:
             fail(
                 f"anchor {current['id']} contract ref not found in CONTRACT.md: {current['contract_ref']}"
@@ -94,18 +136,17 @@ def parse_anchors(anchors_text: str, contract_lines: list[str], source: str) ->
         current = None
 
     for raw_line in anchors_text.splitlines():
+        # One rstrip per line; the header pattern tolerates leading
+        # whitespace itself, so no second strip is needed.
         line = raw_line.rstrip()
-        header = ANCHOR_HEADER_RE.match(line.strip())
-        if header:
+        header = ANCHOR_HEADER_RE.match(line)
+        if header and (header.group(2) or header.group(3)):
             flush()
-            anchor_id = header.group(1)
-            rest = header.group(2).strip()
-            ref_match = CONTRACT_REF_RE.search(rest)
-            contract_ref = ""
-            title = rest
-            if ref_match:
-                contract_ref = ref_match.group(1).strip()
-                title = rest[: ref_match.start()].rstrip()
+            # Interned ids make the duplicate check and downstream
+            # comparisons pointer-fast.
+            anchor_id = sys.intern(header.group(1))
+            title = header.group(2)
+            contract_ref = (header.group(3) or "").strip()
             if not title:
                 fail(f"anchor {anchor_id} missing title: {line}")
             current = {"id": anchor_id, "title": title, "contract_ref": contract_ref}
@@ -135,10 +176,18 @@ def parse_validation_rules(rules_text: str, source: str) -> list[dict]:
         nonlocal current
         if current is None:
             return
-        missing = [
-            key for key in ("id", "title", "contract_ref", "rule") if not current.get(key)
-        ]
-        if missing:
+        # Track absent required fields as bits; names are only
+        # reconstructed on the failure path.
+        missing_mask = 0
+        for bit, key in enumerate(REQUIRED_RULE_FIELDS):
+            if not current.get(key):
+                missing_mask |= 1 << bit
+        if missing_mask:
+            missing = [
+                key
+                for bit, key in enumerate(REQUIRED_RULE_FIELDS)
+                if missing_mask >> bit & 1
+            ]
             fail(
                 f"validation rule {current.get('id', '<unknown>')} missing fields: {', '.join(missing)}"
             )
@@ -182,33 +231,30 @@ def parse_validation_rules(rules_text: str, source: str) -> list[dict]:
             continue
         if current is None:
             continue
-        field_match = FIELD_RE.match(line.strip())
+        field_match = FIELD_RE.match(line)
         if field_match:
             gate_block = False
             label = field_match.group(1).strip()
             value = field_match.group(2).strip()
-            label_lower = label.lower()
-            if label_lower in ("contract ref", "contract citation"):
-                current["contract_ref"] = extract_contract_ref(value) or value
-                continue
-            if label_lower == "rule":
-                current["rule"] = value
-                continue
-            if label_lower == "trigger" and not current["rule"]:
-                current["rule"] = value
-                continue
-            if label_lower == "failure mode" and not current["rule"]:
-                current["rule"] = value
-                continue
-            if label_lower == "gate id":
-                if value:
-                    ids = GATE_ID_RE.findall(value)
-                    if not ids:
-                        fail(f"gate id field missing VR-XXX value: {line}")
-                    current["gate_ids"].extend(ids)
-                else:
-                    gate_block = True
-                continue
+            action = FIELD_LABEL_ACTIONS.get(label.lower())
+            if action is not None:
+                if action == "contract_ref":
+                    current["contract_ref"] = extract_contract_ref(value) or value
+                    continue
+                if action == "gate_id":
+                    if value:
+                        ids = GATE_ID_RE.findall(value)
+                        if not ids:
+                            fail(f"gate id field missing VR-XXX value: {line}")
+                        current["gate_ids"].extend(ids)
+                    else:
+                        gate_block = True
+                    continue
+                if action == "rule" or not current["rule"]:
+                    current["rule"] = value
+                    continue
+                # Trigger/Failure mode with the rule already set falls
+                # through to generic field collection.
             if value:
                 key = normalize_field_name(label)
                 current["fields"].setdefault(key, []).append(value)
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-import subprocess
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -11,8 +11,16 @@ def main() -> int:
     if not TOOL.is_file():
         print(f"ERROR: missing tool: {TOOL}", file=sys.stderr)
         return 1
-    result = subprocess.run([sys.executable, str(TOOL), *sys.argv[1:]])
-    return result.returncode
+    # Import the tool and call its main() directly instead of paying for a
+    # second interpreter startup via subprocess.
+    spec = importlib.util.spec_from_file_location("f1_certify_tool", TOOL)
+    if spec is None or spec.loader is None:
+        print(f"ERROR: unable to load tool: {TOOL}", file=sys.stderr)
+        return 1
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.argv = [str(TOOL), *sys.argv[1:]]
+    return module.main()
 
 
 if __name__ == "__main__":
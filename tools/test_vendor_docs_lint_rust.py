@@ -0,0 +1,106 @@
+import io
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+TOOL = ROOT / "tools" / "vendor_docs_lint_rust.py"
+
+sys.path.insert(0, str(TOOL.parent))
+import vendor_docs_lint_rust as lint  # noqa: E402
+
+BASE_LOCK = """\
+[[package]]
+name = "serde"
+version = "1.0.0"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+
+[[package]]
+name = "itoa"
+version = "2.0.0"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+"""
+
+
+def run_git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+def init_repo(tmp_path: Path) -> Path:
+    """Scratch repo holding the lint tool, an interest list, and a base commit."""
+    repo = tmp_path / "repo"
+    (repo / "tools").mkdir(parents=True)
+    shutil.copy2(TOOL, repo / "tools" / TOOL.name)
+    crates_yaml = repo / "specs" / "vendor_docs" / "rust" / "CRATES_OF_INTEREST.yaml"
+    crates_yaml.parent.mkdir(parents=True)
+    crates_yaml.write_text("crates:\n  - serde\n", encoding="utf-8")
+    (repo / "Cargo.lock").write_text(BASE_LOCK, encoding="utf-8")
+    run_git(repo, "init", "-q")
+    run_git(repo, "config", "user.email", "lint-test@example.com")
+    run_git(repo, "config", "user.name", "lint test")
+    run_git(repo, "add", "-A")
+    run_git(repo, "commit", "-qm", "base")
+    run_git(repo, "branch", "base")
+    return repo
+
+
+def bump_version(repo: Path, old: str, new: str) -> None:
+    lock = repo / "Cargo.lock"
+    lock.write_text(
+        lock.read_text(encoding="utf-8").replace(old, new), encoding="utf-8"
+    )
+    run_git(repo, "commit", "-aqm", "bump")
+
+
+def run_lint(repo: Path) -> subprocess.CompletedProcess:
+    env = os.environ.copy()
+    env["BASE_REF"] = "base"
+    env.pop("CI", None)
+    return subprocess.run(
+        [sys.executable, str(repo / "tools" / TOOL.name)],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_interest_version_bump_does_not_take_early_exit(tmp_path: Path) -> None:
+    # A version-only bump of an interest crate must reach the full check.
+    # The gate's soundness rests on the -U1 hunk carrying the adjacent
+    # name = "serde" context line; with no snapshot present the lint must
+    # fail closed, not early-exit with OK. Guards against "simplifying"
+    # the gate to e.g. --name-only, which would be unsound.
+    repo = init_repo(tmp_path)
+    bump_version(repo, 'version = "1.0.0"', 'version = "1.0.1"')
+
+    result = run_lint(repo)
+
+    assert result.returncode == 1
+    assert "no crates of interest changed" not in result.stdout
+    assert "Missing snapshot" in result.stderr
+    assert "serde/1.0.1" in result.stderr
+
+
+def test_non_interest_change_takes_early_exit(tmp_path: Path) -> None:
+    # A bump that touches only a non-interest crate is waved through.
+    repo = init_repo(tmp_path)
+    bump_version(repo, 'version = "2.0.0"', 'version = "2.0.1"')
+
+    result = run_lint(repo)
+
+    assert result.returncode == 0
+    assert "no crates of interest changed" in result.stdout
+
+
+def test_lock_parsers_agree_on_repo_lockfile() -> None:
+    # parse_lock_stream (base lockfile off the git show pipe) and
+    # parse_lock_packages (current lockfile as one string) compute the two
+    # sides of the version-set diff; if they ever disagree, old and new
+    # versions are extracted by different rules and the lint can be wrong
+    # in either direction. Pin their equivalence on the real Cargo.lock.
+    text = (ROOT / "Cargo.lock").read_text(encoding="utf-8", errors="replace")
+    packages = lint.parse_lock_packages(text)
+    assert packages
+    assert lint.parse_lock_stream(io.StringIO(text)) == packages
@@ -17,9 +17,32 @@ import re
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
+
+# Cargo always writes name directly followed by version inside a
+# [[package]] block, so one multi-group pattern captures both in a single
+# scan of the lockfile.
+LOCK_PACKAGE_RE = re.compile(
+    r'^\[\[package\]\]\s*?\n\s*name\s*=\s*"([^"]+)"\s*?\n\s*version\s*=\s*"([^"]+)"',
+    re.M,
+)
+
+# The top-level "crates:" block runs until the first line that is neither
+# indented, blank, nor a comment; entries are two-space-indented list
+# items or bare mapping keys, with optional trailing comments.
+LOCK_NAME_RE = re.compile(r'\s*name\s*=\s*"([^"]+)"')
+LOCK_VERSION_RE = re.compile(r'\s*version\s*=\s*"([^"]+)"')
+
+CRATES_BLOCK_RE = re.compile(
+    r"^crates:[ \t]*(?:#[^\n]*)?\n((?:(?:[ \t#][^\n]*)?\n?)*)", re.M
+)
+CRATE_ENTRY_RE = re.compile(
+    r"^ {2}(?:-[ \t]*([A-Za-z0-9_.-]+)|([A-Za-z0-9_.-]+)[ \t]*:)[ \t]*(?:#[^\n]*)?$",
+    re.M,
+)
 CARGO_LOCK = ROOT / "Cargo.lock"
 CRATES_YAML = ROOT / "specs" / "vendor_docs" / "rust" / "CRATES_OF_INTEREST.yaml"
 SNAP_ROOT = ROOT / "specs" / "vendor_docs" / "rust" / "crates"
@@ -30,11 +53,10 @@ def eprint(msg: str) -> None:
 
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        # hashlib.file_digest streams the file in C, without the
+        # per-chunk Python loop.
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def git_available() -> bool:
@@ -58,46 +80,54 @@ def load_crates_of_interest(path: Path) -> list[str]:
     if not path.exists():
         raise FileNotFoundError(str(path))
 
-    crates: list[str] = []
-    in_crates = False
-    for raw in path.read_text(encoding="utf-8", errors="replace").splitlines():
-        line = raw.split("#", 1)[0].rstrip()
-        if not line.strip():
-            continue
-        if not line.startswith(" "):
-            in_crates = line.strip() == "crates:"
-            continue
-        if not in_crates:
-            continue
+    text = path.read_text(encoding="utf-8", errors="replace")
+    block_match = CRATES_BLOCK_RE.search(text)
+    if not block_match:
+        return []
 
-        list_match = re.match(r"^\s{2}-\s*([A-Za-z0-9_.-]+)\s*$", line)
-        if list_match:
-            crates.append(list_match.group(1))
-            continue
+    return list(
+        dict.fromkeys(
+            list_name or map_name
+            for list_name, map_name in CRATE_ENTRY_RE.findall(block_match.group(1))
+        )
+    )
 
-        map_match = re.match(r"^\s{2}([A-Za-z0-9_.-]+)\s*:\s*$", line)
-        if map_match:
-            crates.append(map_match.group(1))
 
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for crate in crates:
-        if crate not in seen:
-            ordered.append(crate)
-            seen.add(crate)
-    return ordered
+def parse_lock_packages(lock_text: str) -> dict[str, frozenset[str]]:
+    acc: dict[str, set[str]] = {}
+    for name, version in LOCK_PACKAGE_RE.findall(lock_text):
+        # Interned names make the crate-key lookups and comparisons against
+        # CRATES_OF_INTEREST pointer-equality checks.
+        acc.setdefault(sys.intern(name), set()).add(version)
+    return {name: frozenset(versions) for name, versions in acc.items()}
+
 
+def parse_lock_stream(lines) -> dict[str, frozenset[str]]:
+    """Streaming variant of parse_lock_packages over an iterable of lines.
 
-def parse_lock_packages(lock_text: str) -> dict[str, set[str]]:
-    out: dict[str, set[str]] = {}
-    for block in lock_text.split("[[package]]")[1:]:
-        name_m = re.search(r'^\s*name\s*=\s*"([^"]+)"', block, re.M)
-        ver_m = re.search(r'^\s*version\s*=\s*"([^"]+)"', block, re.M)
-        if name_m and ver_m:
-            name = name_m.group(1)
-            ver = ver_m.group(1)
-            out.setdefault(name, set()).add(ver)
-    return out
+    Lets the base lockfile be consumed straight off a git show pipe
+    without materializing the whole file as one string.
+    """
+    acc: dict[str, set[str]] = {}
+    name = ""
+    state = 0  # 0: idle, 1: expecting name, 2: expecting version
+    for raw in lines:
+        if raw.strip() == "[[package]]":
+            state = 1
+            continue
+        if state == 1:
+            match = LOCK_NAME_RE.match(raw)
+            if match:
+                name = sys.intern(match.group(1))
+                state = 2
+            else:
+                state = 0
+        elif state == 2:
+            match = LOCK_VERSION_RE.match(raw)
+            if match:
+                acc.setdefault(name, set()).add(match.group(1))
+            state = 0
+    return {name: frozenset(versions) for name, versions in acc.items()}
 
 
 def read_metadata_json(path: Path) -> dict:
@@ -105,6 +135,56 @@ def read_metadata_json(path: Path) -> dict:
         return json.load(f)
 
 
+def verify_snapshot(
+    crate: str, version: str, cargo_lock_hash: str, require_features: bool
+) -> tuple[list[str], list[str]]:
+    """Verify one crate/version snapshot; returns (failures, warnings)."""
+    failures: list[str] = []
+    warnings: list[str] = []
+
+    # One open() answers both existence and contents; no separate
+    # stat round trip.
+    md_path = SNAP_ROOT / crate / version / "metadata.json"
+    try:
+        md = read_metadata_json(md_path)
+    except FileNotFoundError:
+        failures.append(
+            f"Missing snapshot: specs/vendor_docs/rust/crates/{crate}/{version}/metadata.json"
+        )
+        return failures, warnings
+    except json.JSONDecodeError as exc:
+        failures.append(f"Invalid JSON in {md_path}: {exc}")
+        return failures, warnings
+
+    if md.get("crate") != crate or md.get("version") != version:
+        failures.append(f"Snapshot metadata crate/version mismatch for {crate} {version}")
+
+    if md.get("cargo_lock_sha256") != cargo_lock_hash:
+        failures.append(
+            f"Snapshot lock hash mismatch for {crate} {version}: "
+            f"metadata has {md.get('cargo_lock_sha256')}, expected {cargo_lock_hash}"
+        )
+
+    features_path = SNAP_ROOT / crate / version / "features.txt"
+    try:
+        contents = features_path.read_text(encoding="utf-8", errors="replace").strip()
+    except FileNotFoundError:
+        msg = f"Missing features.txt for {crate} {version}"
+        if require_features:
+            failures.append(msg)
+        else:
+            warnings.append(msg)
+    else:
+        if not contents:
+            msg = f"Empty features.txt for {crate} {version}"
+            if require_features:
+                failures.append(msg)
+            else:
+                warnings.append(msg)
+
+    return failures, warnings
+
+
 def main() -> int:
     is_ci = bool(os.environ.get("CI"))
     base_ref = os.environ.get("BASE_REF", "origin/main")
@@ -134,17 +214,14 @@ def main() -> int:
         eprint(msg)
         return 0
 
-    diff = run_git(["diff", "--name-only", f"{base_ref}...HEAD", "--", "Cargo.lock"])
-    if diff.returncode != 0:
-        eprint(f"FAIL: git diff failed: {diff.stderr.strip()}")
-        return 2
-    if not diff.stdout.strip():
+    # --quiet answers changed/unchanged via the exit code (0/1) without
+    # generating or capturing any diff output.
+    diff = run_git(["diff", "--quiet", "--exit-code", f"{base_ref}...HEAD", "--", "Cargo.lock"])
+    if diff.returncode == 0:
         print("OK: Cargo.lock unchanged; skipping vendor docs lint.")
         return 0
-
-    old_lock = run_git(["show", f"{base_ref}:Cargo.lock"])
-    if old_lock.returncode != 0:
-        eprint(f"FAIL: unable to read base Cargo.lock: {old_lock.stderr.strip()}")
+    if diff.returncode != 1:
+        eprint(f"FAIL: git diff failed: {diff.stderr.strip()}")
         return 2
 
     crates = load_crates_of_interest(CRATES_YAML)
@@ -152,62 +229,69 @@ def main() -> int:
         eprint("FAIL: no crates listed in CRATES_OF_INTEREST.yaml")
         return 2
 
+    # Cheap gate before parsing either lockfile: if no interest crate is
+    # mentioned anywhere in the Cargo.lock diff, the version sets we care
+    # about cannot have changed. Any doubt (diff failure, crate mentioned
+    # even in an unrelated hunk) falls through to the full parse.
+    lock_diff = run_git(["diff", "--unified=1", f"{base_ref}...HEAD", "--", "Cargo.lock"])
+    if lock_diff.returncode == 0 and lock_diff.stdout:
+        if not any(f'"{crate}"' in lock_diff.stdout for crate in crates):
+            print("OK: Cargo.lock changed, but no crates of interest changed.")
+            return 0
+
+    # Only read the base lockfile once an interest crate is actually
+    # implicated by the diff, and parse it straight off the git show
+    # pipe rather than buffering the whole file first.
+    show_proc = subprocess.Popen(
+        ["git", "-C", str(ROOT), "show", f"{base_ref}:Cargo.lock"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    assert show_proc.stdout is not None
+    old_pkgs = parse_lock_stream(show_proc.stdout)
+    _, show_err = show_proc.communicate()
+    if show_proc.returncode != 0:
+        eprint(f"FAIL: unable to read base Cargo.lock: {show_err.strip()}")
+        return 2
+
     cargo_lock_hash = sha256_file(CARGO_LOCK)
-    old_pkgs = parse_lock_packages(old_lock.stdout)
     new_pkgs = parse_lock_packages(CARGO_LOCK.read_text(encoding="utf-8", errors="replace"))
 
+    # Resolve each interest crate's new-only versions once, up front; the
+    # verification fan-out then iterates plain lists with no further set
+    # arithmetic or dict probing.
+    new_only_per_crate: dict[str, list[str]] = {}
+    for crate in crates:
+        new_only = sorted(
+            new_pkgs.get(crate, frozenset()) - old_pkgs.get(crate, frozenset())
+        )
+        if new_only:
+            new_only_per_crate[crate] = new_only
+
+    targets = [
+        (crate, version)
+        for crate, versions in new_only_per_crate.items()
+        for version in versions
+    ]
+    checked = len(targets)
+
     failures: list[str] = []
     warnings: list[str] = []
-    checked = 0
-
-    for crate in crates:
-        new_versions = new_pkgs.get(crate, set())
-        if not new_versions:
-            continue
-        old_versions = old_pkgs.get(crate, set())
-        new_only = sorted(new_versions - old_versions)
-        if not new_only:
-            continue
 
-        for version in new_only:
-            checked += 1
-            md_path = SNAP_ROOT / crate / version / "metadata.json"
-            if not md_path.exists():
-                failures.append(
-                    f"Missing snapshot: specs/vendor_docs/rust/crates/{crate}/{version}/metadata.json"
-                )
-                continue
-
-            try:
-                md = read_metadata_json(md_path)
-            except json.JSONDecodeError as exc:
-                failures.append(f"Invalid JSON in {md_path}: {exc}")
-                continue
-
-            if md.get("crate") != crate or md.get("version") != version:
-                failures.append(f"Snapshot metadata crate/version mismatch for {crate} {version}")
-
-            if md.get("cargo_lock_sha256") != cargo_lock_hash:
-                failures.append(
-                    f"Snapshot lock hash mismatch for {crate} {version}: "
-                    f"metadata has {md.get('cargo_lock_sha256')}, expected {cargo_lock_hash}"
-                )
-
-            features_path = SNAP_ROOT / crate / version / "features.txt"
-            if not features_path.exists():
-                msg = f"Missing features.txt for {crate} {version}"
-                if require_features:
-                    failures.append(msg)
-                else:
-                    warnings.append(msg)
-            else:
-                contents = features_path.read_text(encoding="utf-8", errors="replace").strip()
-                if not contents:
-                    msg = f"Empty features.txt for {crate} {version}"
-                    if require_features:
-                        failures.append(msg)
-                    else:
-                        warnings.append(msg)
+    if targets:
+        # Snapshot checks are independent, filesystem-bound reads; verify
+        # them concurrently and collect results in submission order so
+        # output stays deterministic.
+        with ThreadPoolExecutor(max_workers=min(8, len(targets))) as pool:
+            futures = [
+                pool.submit(verify_snapshot, crate, version, cargo_lock_hash, require_features)
+                for crate, version in targets
+            ]
+        for future in futures:
+            crate_failures, crate_warnings = future.result()
+            failures.extend(crate_failures)
+            warnings.extend(crate_warnings)
 
     if checked == 0:
         print("OK: Cargo.lock changed, but no crates of interest changed.")